@@ -4,11 +4,204 @@ Calculate a min, max, mean, sum of for each of the distinct values in specified
 Save output to the csv file.
 """
 
+import functools
+import itertools
 import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, Tuple
+
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
 from utilities.cleaner import Cleaner
 from utilities.aggregator import Aggregator
+from utilities import pure_py
+
+BACKENDS = ["pandas", "numba", "pypy"]
+
+
+def process_chunk(
+    dframe: pd.DataFrame, cleaner: Cleaner, aggregator: Aggregator
+) -> pd.DataFrame:
+    """
+    Clean chunk of the data and calculate partial results of aggregates for it.
+
+    Parameters:
+        * dframe (pd.DataFrame): chunk of the data read from csv file
+        * cleaner (Cleaner): cleaner to validate and clean data with
+        * aggregator (Aggregator): aggregator to calculate partial results with
+
+    Returns:
+        * dframe (pd.DataFrame): dataframe with grouped data and partial results
+    """
+    cleaner.validate_input(dframe)
+
+    # Filters are applied with masks only, without resetting index after each of them.
+    dframe = cleaner.list_from_string(dframe)
+    dframe = dframe.loc[cleaner.even_rows_mask(dframe)]
+
+    logging.info("Transforming elements of a list-like rows into separate rows.")
+    dframe = dframe.explode([*cleaner.columns_info.keys()], ignore_index=True)
+
+    dframe = dframe.loc[cleaner.non_empty_mask(dframe)]
+    dframe = cleaner.convert_types(dframe)
+    dframe = dframe.loc[cleaner.greater_than_zero_mask(dframe)]
+    logging.info("Finished cleaning data!")
+
+    aggregator.validate_input(dframe)
+    return aggregator.calculate_partials(dframe)
+
+
+def _process_in_workers(
+    process: Callable, chunks: Iterator[Tuple[int, pd.DataFrame]], max_workers: int
+) -> dict:
+    """
+    Process numbered chunks in worker processes, submitting a new chunk
+    as soon as any of the workers finishes. Return results by chunk numbers.
+    """
+    results = {}
+    # Workers are spawned, as forking a process that already runs threads
+    # (e.g. of pyarrow or Numba) may deadlock.
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pending = {
+            executor.submit(process, chunk): number
+            for number, chunk in itertools.islice(chunks, 2 * max_workers)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+            for number, chunk in itertools.islice(chunks, len(done)):
+                pending[executor.submit(process, chunk)] = number
+    return results
+
+
+def process_chunks(
+    input_path: str,
+    cleaner: Cleaner,
+    aggregator: Aggregator,
+    chunksize: int,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Read csv file in chunks, clean them and calculate partial results of aggregates
+    in parallel processes, then combine partial results into aggregates.
+    A new chunk is submitted as soon as any of the workers finishes,
+    at most twice "max_workers" chunks are read into memory at once.
+    Chunks are processed in the current process, without starting workers,
+    if "max_workers" is 1 or the whole file fits in a single chunk.
+
+    Parameters:
+        * input_path (str): path to the csv file containing data to process
+        * cleaner (Cleaner): cleaner to validate and clean data with
+        * aggregator (Aggregator): aggregator to calculate aggregates with
+        * chunksize (int): number of rows read and processed at once
+        * max_workers (int) (optional): number of processes, defaults to
+            number of CPUs
+
+    Returns:
+        * dframe (pd.DataFrame): dataframe with grouped
+            data and calculated aggregates
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    process = functools.partial(process_chunk, cleaner=cleaner, aggregator=aggregator)
+    reader = pd.read_csv(input_path, dtype=str, chunksize=chunksize)
+    # First two chunks are peeked at, to check if there is anything to parallelize.
+    first_chunks = list(itertools.islice(reader, 2))
+    chunks = enumerate(itertools.chain(first_chunks, reader))
+    if max_workers == 1 or len(first_chunks) < 2:
+        logging.info(
+            "Reading data from: %s in chunks of %s rows, processed in main process.",
+            input_path,
+            chunksize,
+        )
+        partials = {number: process(chunk) for number, chunk in chunks}
+    else:
+        logging.info(
+            "Reading data from: %s in chunks of %s rows, processed by %s processes.",
+            input_path,
+            chunksize,
+            max_workers,
+        )
+        partials = _process_in_workers(process, chunks, max_workers)
+    # Partials are combined in order of chunks, so results do not depend on timing.
+    return aggregator.combine_partials(
+        pd.concat([partials[number] for number in sorted(partials)], ignore_index=True)
+    )
+
+
+def write_csv(dframe: pd.DataFrame, output_path: str) -> None:
+    """
+    Save dataframe to csv file with pyarrow's multithreaded csv writer,
+    or with pandas if pyarrow is not installed.
+    Output is the same in both cases: header is written by pandas, values
+    are not quoted and floats are written as their Python representation.
+    Dataframes with values that would need quoting are saved by pandas.
+
+    Parameters:
+        * dframe (pd.DataFrame): dataframe to save
+        * output_path (str): path to the csv file to save dataframe in
+    """
+    if pa is not None:
+        floats = {
+            col: dframe[col].map(repr, na_action="ignore")
+            for col in dframe.select_dtypes("float").columns
+        }
+        table = pa.Table.from_pandas(dframe.assign(**floats), preserve_index=False)
+        try:
+            dframe.head(0).to_csv(f"{output_path}", header=True, index=False)
+            with open(output_path, "ab") as csv_file:
+                pa_csv.write_csv(
+                    table,
+                    csv_file,
+                    pa_csv.WriteOptions(include_header=False, quoting_style="none"),
+                )
+            return
+        except pa.ArrowInvalid:
+            logging.info("Output values need quoting, saving them with pandas.")
+    dframe.to_csv(f"{output_path}", header=True, index=False)
+
+
+def process_pure_py(
+    input_path: str,
+    output_path: str,
+    columns: list,
+    aggregator: Aggregator,
+    rename_cols: dict = None,
+) -> None:
+    """
+    Clean data, calculate aggregates and save them to csv file
+    with pure Python code, without pandas or Numba, so that it can be run with PyPy.
+
+    Parameters:
+        * input_path (str): path to the csv file containing data to process
+        * output_path (str): path to the csv file to save results in
+        * columns (list): expected columns of the input csv file
+        * aggregator (Aggregator): aggregator describing grouping column,
+            values column and aggregates to calculate
+        * rename_cols (dict) (optional): if provided, columns will be renamed based on
+            given info (keys: old column name, values: new column name)
+    """
+    groups = pure_py.clean_and_group(
+        pure_py.read_rows(
+            input_path, columns, aggregator.agg_col, aggregator.values_col
+        )
+    )
+    rows = pure_py.calculate_aggregates(groups, aggregator.agg_names)
+    logging.info("Finished calculating aggregates!")
+
+    rename_cols = rename_cols or {}
+    header = [aggregator.agg_col, *aggregator.agg_names]
+    pure_py.write_rows(output_path, [rename_cols.get(col, col) for col in header], rows)
 
 
 def main(
@@ -19,6 +212,10 @@ def main(
     values_col: str,
     aggregates: list,
     rename_cols: dict = None,
+    backend: str = "pandas",
+    chunksize: int = 65536,
+    engine: str = "cython",
+    max_workers: int = None,
 ) -> None:
     """
     Load data from csv file, clean it and calculate min, max, avg values and sum
@@ -35,54 +232,65 @@ def main(
         * aggregates (list): list of aggregate calculations to apply
         * rename_cols (dict) (optional): if provided, columns will be renamed based on
             given info (keys: old column name, values: new column name)
+        * backend (str) (optional): "pandas" to clean and aggregate data step by step
+            with Cleaner and Aggregator, "numba" to do it in a single pass
+            with a JIT-compiled kernel, "pypy" to do it with pure Python code
+            meant to be run with PyPy
+        * chunksize (int) (optional): number of rows read and processed at once
+            by the "pandas" backend
+        * engine (str) (optional): engine of the "pandas" backend Aggregator,
+            "cython" for pandas built-in reductions, "numba" for jit-compiled ones
+            or "numpy" for NumPy ufunc reductions
+        * max_workers (int) (optional): number of processes cleaning chunks
+            in parallel in the "pandas" backend, defaults to number of CPUs
     """
     logging.basicConfig(
         format="%(levelname)s   %(asctime)s   %(module)s:%(funcName)s\n%(message)s",
         level=logging.INFO,
     )
 
-    logging.info(f"Reading data from: {input_path}.")
-    dframe = pd.read_csv(input_path)
+    assert backend in BACKENDS, f"Backend {backend} not supported: {BACKENDS}."
 
     logging.info(
-        f"Creating instance of a cleaner with given columns info: {columns_info}."
+        "Creating instance of a cleaner with given columns info: %s.", columns_info
     )
     cleaner = Cleaner(columns_info)
-    logging.info(f"Created Cleaner instance: {cleaner}.")
-
-    cleaner.validate_input(dframe)
-
-    logging.info("Dropping missing values.")
-    dframe = dframe.dropna()
-
-    dframe = cleaner.list_from_string(dframe)
-    dframe = cleaner.filter_uneven_rows(dframe)
+    logging.info("Created Cleaner instance: %s.", cleaner)
 
-    logging.info("Transforming elements of a list-like rows into separate rows.")
-    dframe = dframe.apply(pd.Series.explode)
+    aggregator = Aggregator(agg_col, values_col, aggregates, engine)
+    logging.info("Created Aggregator instance: %s.", aggregator)
 
-    dframe = cleaner.drop_empty_string(dframe)
-    dframe = cleaner.convert_types(dframe)
-    dframe = cleaner.filter_greater_than_zero(dframe)
-    logging.info("Finished cleaning data!")
+    if backend == "pypy":
+        process_pure_py(
+            input_path, output_path, [*columns_info.keys()], aggregator, rename_cols
+        )
+        return
 
-    aggregator = Aggregator(agg_col, values_col, aggregates)
-    logging.info(f"Created Aggregator instance: {aggregator}.")
+    if backend == "numba":
+        # Imported only here, as Numba is optional and does not support PyPy.
+        from utilities.fast_pipeline import (  # pylint: disable = C0415
+            clean_and_aggregate,
+        )
 
-    aggregator.validate_input(dframe)
-    dframe = aggregator.calculate_aggregates(dframe)
-    logging.info("Finished cleaning data!")
+        logging.info("Reading data from: %s.", input_path)
+        dframe = pd.read_csv(input_path, dtype=str)
+        cleaner.validate_input(dframe)
+        dframe = clean_and_aggregate(dframe, aggregator)
+    else:
+        dframe = process_chunks(input_path, cleaner, aggregator, chunksize, max_workers)
+    logging.info("Finished calculating aggregates!")
 
     if rename_cols:
         logging.info(
-            f"Renaming columns: {[*rename_cols.keys()]} to",
-            f"{[*rename_cols.values()]} respectively.",
+            "Renaming columns: %s to %s respectively.",
+            rename_cols.keys(),
+            rename_cols.values(),
         )
         dframe.rename(columns=rename_cols, inplace=True)
 
-    logging.info(f"Saving output data to: {output_path}.")
-    dframe.to_csv(f"{output_path}", header=True, index=False)
-    logging.info(f"Finished saving output data to: {output_path}.")
+    logging.info("Saving output data to: %s.", output_path)
+    write_csv(dframe, output_path)
+    logging.info("Finished saving output data to: %s.", output_path)
 
 
 if __name__ == "__main__":
@@ -7,5 +7,6 @@ setup(
     author="Marcin Łobaczewski",
     author_email="marcin.lobaczewski@gmail.com",
     packages=find_packages(),
-    install_requires=["pandas>=1.1.3"],
+    install_requires=["pandas>=1.3.0"],
+    extras_require={"numba": ["numba>=0.53"], "pyarrow": ["pyarrow>=13.0"]},
 )
@@ -1,5 +1,6 @@
 """utilities.aggregator test suite"""
 
+import numpy as np
 import pandas as pd
 import pytest
 from utilities.aggregator import Aggregator
@@ -135,3 +136,182 @@ def test_calculate_aggregates(helpers, aggregates, expected_df):
     )
     out_df = aggregator.calculate_aggregates(input_df)
     assert helpers.df_equal(expected_df, out_df)
+
+
+def test_calculate_partials(helpers, aggregator):
+    """Calculate partial results (min, max, sum, count) for part of the data."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh2.moc", "tosh3.moc", "tosh1.moc", "tosh1.moc", "tosh2.moc"],
+            "col_b": [1.0, 3.0, 9.0, 1.0, 2.0],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh3.moc"],
+            "min": [1.0, 1.0, 3.0],
+            "max": [9.0, 2.0, 3.0],
+            "sum": [10.0, 3.0, 3.0],
+            "count": [2, 2, 1],
+        }
+    )
+    out_df = aggregator.calculate_partials(input_df)
+    assert helpers.df_equal(expected_df, out_df)
+
+
+def test_combine_partials(helpers, aggregator):
+    """Combine partial results of several parts of the data into aggregates."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh1.moc", "tosh3.moc"],
+            "min": [1.0, 1.0, 4.0, 3.0],
+            "max": [9.0, 2.0, 5.0, 3.0],
+            "sum": [10.0, 3.0, 9.0, 3.0],
+            "count": [2, 2, 2, 1],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh3.moc"],
+            "min": [1.0, 1.0, 3.0],
+            "max": [9.0, 2.0, 3.0],
+            "avg": [4.75, 1.5, 3.0],
+            "sum": [19.0, 3.0, 3.0],
+        }
+    )
+    out_df = aggregator.combine_partials(input_df)
+    assert helpers.df_equal(expected_df, out_df)
+
+
+def test_calculate_aggregates_numba_engine(helpers):
+    """Perform calculations for aggregates with reductions jit-compiled by Numba."""
+    aggregator = Aggregator(
+        agg_col="col_a",
+        values_col="col_b",
+        aggregates=["min", "max", "avg", "sum"],
+        engine="numba",
+    )
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh2.moc", "tosh3.moc", "tosh1.moc", "tosh1.moc", "tosh2.moc"],
+            "col_b": [1.0, 3.0, 9.0, 1.0, 2.0],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh3.moc"],
+            "min": [1.0, 1.0, 3.0],
+            "max": [9.0, 2.0, 3.0],
+            "avg": [5.0, 1.5, 3.0],
+            "sum": [10.0, 3.0, 3.0],
+        }
+    )
+    out_df = aggregator.calculate_aggregates(input_df)
+    assert helpers.df_equal(expected_df, out_df)
+
+
+def test_calculate_partials_numba_engine(helpers):
+    """
+    Calculate partial results with Numba JIT-compiled kernel,
+    same as with pandas GroupBy, also for keys with missing values only.
+    """
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh2.moc", "tosh1.moc", "tosh2.moc", "tosh3.moc"],
+            "col_b": [1.0, 9.0, 2.0, np.nan],
+        }
+    )
+    numba_aggregator, cython_aggregator = (
+        Aggregator(agg_col="col_a", values_col="col_b", aggregates=["min"], engine=e)
+        for e in ("numba", "cython")
+    )
+    out_df = numba_aggregator.calculate_partials(input_df)
+    assert out_df["count"].tolist() == [1, 2, 0]
+    assert helpers.df_equal(out_df, cython_aggregator.calculate_partials(input_df))
+
+
+def test_unsupported_engine():
+    """Raise AssertionError when unsupported engine is passed."""
+    with pytest.raises(AssertionError):
+        Aggregator(
+            agg_col="col_a", values_col="col_b", aggregates=["min"], engine="wrong"
+        )
+
+
+def test_calculate_aggregates_numpy_engine(helpers):
+    """Perform calculations for aggregates with NumPy ufunc reductions."""
+    aggregator = Aggregator(
+        agg_col="col_a",
+        values_col="col_b",
+        aggregates=["min", "max", "avg", "sum"],
+        engine="numpy",
+    )
+    input_df = pd.DataFrame(
+        {
+            "col_a": [
+                "tosh2.moc",
+                "tosh3.moc",
+                "tosh1.moc",
+                "tosh1.moc",
+                "tosh2.moc",
+                "tosh3.moc",
+            ],
+            "col_b": [1, 3, 9, 1, 2, 4],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh3.moc"],
+            "min": [1, 1, 3],
+            "max": [9, 2, 4],
+            "avg": [5, 1.5, 3.5],
+            "sum": [10, 3, 7],
+        }
+    )
+    out_df = aggregator.calculate_aggregates(input_df)
+    assert helpers.df_equal(expected_df, out_df)
+
+
+def test_calculate_aggregates_numpy_engine_missing_values(helpers):
+    """
+    Keep keys with missing values only, same as pandas GroupBy,
+    when calculating aggregates with NumPy ufunc reductions.
+    """
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc", "tosh1.moc"],
+            "col_b": [1.0, np.nan, 2.0],
+        }
+    )
+    numpy_aggregator, cython_aggregator = (
+        Aggregator(
+            agg_col="col_a",
+            values_col="col_b",
+            aggregates=["min", "max", "avg", "sum"],
+            engine=engine,
+        )
+        for engine in ("numpy", "cython")
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc"],
+            "min": [1.0, np.nan],
+            "max": [2.0, np.nan],
+            "avg": [1.5, np.nan],
+            "sum": [3.0, 0.0],
+        }
+    )
+    out_df = numpy_aggregator.calculate_aggregates(input_df)
+    assert helpers.df_equal(out_df, expected_df)
+    assert helpers.df_equal(out_df, cython_aggregator.calculate_aggregates(input_df))
+
+
+def test_calculate_partials_numpy_engine_empty():
+    """Calculate partial results for empty data with NumPy ufunc reductions."""
+    aggregator = Aggregator(
+        agg_col="col_a", values_col="col_b", aggregates=["min"], engine="numpy"
+    )
+    input_df = pd.DataFrame({"col_a": ["tosh1.moc"], "col_b": [1.0]}).iloc[:0]
+    out_df = aggregator.calculate_partials(input_df)
+    assert out_df.empty
+    assert [*out_df.columns] == ["col_a", "min", "max", "sum", "count"]
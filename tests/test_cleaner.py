@@ -1,4 +1,6 @@
 """utilities.cleaner test suite"""
+
+import numpy as np
 import pytest
 import pandas as pd
 from utilities.cleaner import Cleaner
@@ -55,15 +57,32 @@ def test_validate_input_negative():
 @pytest.mark.parametrize(
     "test_input,expected",
     [
-        ("['tosh2.moc','tosh4.moc']", ["'tosh2.moc'", "'tosh4.moc'"]),
+        ("['tosh2.moc','tosh4.moc']", ["tosh2.moc", "tosh4.moc"]),
+        ("['tosh2.moc','']", ["tosh2.moc", ""]),
+        ("['tosh2.moc',,'tosh4.moc']", ["tosh2.moc", "", "tosh4.moc"]),
+        ("[tosh2.moc,tosh4.moc]", ["tosh2.moc", "tosh4.moc"]),
+    ],
+)
+def test_parse_str_col(cleaner, test_input, expected):
+    """Convert list-like looking strings into lists of elements without quotes."""
+    out_col = cleaner._parse_str_col(pd.Series([test_input]))  # pylint: disable = W0212
+    assert out_col[0] == expected
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
         ("[1301.62,9203.05]", ["1301.62", "9203.05"]),
+        ("[1301.62,,-1]", ["1301.62", "", "-1"]),
     ],
 )
-def test_convert_to_list(cleaner, test_input, expected):
-    """Convert from list-like looking string into actual list."""
-    out_list = cleaner._convert_to_list(test_input)  # pylint: disable = W0212
-    assert isinstance(out_list, list)
-    assert out_list == expected
+def test_parse_num_col(cleaner, test_input, expected):
+    """Split list-like looking strings on commas, keeping empty elements."""
+    out_col = cleaner._parse_num_col(  # pylint: disable = W0212
+        pd.Series([test_input, np.nan])
+    )
+    assert out_col[0] == expected
+    assert pd.isna(out_col[1])
 
 
 def test_list_from_string(helpers, cleaner):
@@ -89,9 +108,9 @@ def test_list_from_string(helpers, cleaner):
     expected = pd.DataFrame(
         {
             "col_a": [
-                ["'tosh1.moc'"],
-                ["'tosh2.moc'", "'tosh4.moc'"],
-                ["'tosh1.moc'", "'tosh4.moc'", "'tosh1.moc'", "'tosh4.moc'"],
+                ["tosh1.moc"],
+                ["tosh2.moc", "tosh4.moc"],
+                ["tosh1.moc", "tosh4.moc", "tosh1.moc", "tosh4.moc"],
             ],
             "col_b": [
                 ["3063.33"],
@@ -104,6 +123,21 @@ def test_list_from_string(helpers, cleaner):
     assert helpers.df_equal(out_df, expected)
 
 
+def test_list_from_string_empty_elements(helpers, cleaner):
+    """Keep slots of empty elements of numeric columns."""
+    input_df = pd.DataFrame(
+        {"col_a": ["['tosh1.moc','tosh2.moc','tosh1.moc']"], "col_b": ["[1,,2]"]}
+    )
+    expected = pd.DataFrame(
+        {
+            "col_a": [["tosh1.moc", "tosh2.moc", "tosh1.moc"]],
+            "col_b": [["1", "", "2"]],
+        }
+    )
+    out_df = cleaner.list_from_string(input_df)
+    assert helpers.df_equal(out_df, expected)
+
+
 def test_filter_uneven_rows(helpers, cleaner):
     """Filter out rows with uneven number of elements"""
     input_df = pd.DataFrame(
@@ -158,12 +192,10 @@ def test_filter_greater_than_zero(helpers, cleaner):
     assert helpers.df_equal(out_df, expected_df)
 
 
-@pytest.mark.xfail()
 def test_filter_greater_than_zero_2_num_cols(helpers):
     """
     Filter out rows with non-positive values in numeric columns,
     when there are is more than one numeric columns.
-    Now failing with: ValueError: Cannot index with multidimensional key.
     """
     cleaner = Cleaner(columns_info={"col_a": "float", "col_b": "float"})
     input_df = pd.DataFrame(
@@ -256,3 +288,50 @@ def test_convert_types_given_info(helpers, cleaner):
     test_info = {"col_a": "string", "col_b": "string"}
     out_df = cleaner.convert_types(input_df, columns_info=test_info)
     assert helpers.df_equal(out_df, expected_df)
+
+
+def test_convert_types_not_numbers(helpers, cleaner):
+    """Convert elements of numeric columns that are not numbers into NaN."""
+    input_df = pd.DataFrame({"col_a": ["tosh1.moc"] * 3, "col_b": ["1.5", "", "abc"]})
+    expected_df = pd.DataFrame(
+        {"col_a": ["tosh1.moc"] * 3, "col_b": [1.5, np.nan, np.nan]}
+    ).astype({"col_a": "string"})
+    out_df = cleaner.convert_types(input_df)
+    assert helpers.df_equal(out_df, expected_df)
+
+
+def test_even_rows_mask_missing_values(cleaner):
+    """Mask out rows with uneven number of elements or missing values."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": [["'tosh1.moc'"], np.nan, ["'tosh1.moc'", "'tosh2.moc'"]],
+            "col_b": [["3063.33"], ["1301.62"], ["7026.18"]],
+        }
+    )
+    out_mask = cleaner.even_rows_mask(input_df)
+    assert out_mask.tolist() == [True, False, False]
+
+
+def test_non_empty_mask_string_columns_only(cleaner):
+    """Mask out empty string values in string columns only."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "", np.nan, "tosh2.moc"],
+            "col_b": [3063.33, 1301.62, -1, np.nan],
+        }
+    )
+    out_mask = cleaner.non_empty_mask(input_df)
+    assert out_mask.tolist() == [True, False, False, True]
+
+
+def test_convert_types_already_converted(cleaner):
+    """Return dataframe as it is when columns are already of given types."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["0", "", "tosh1.moc", "tosh1.moc"],
+            "col_b": [3063.33, 1301.62, -1, 0],
+        }
+    ).astype({"col_a": "string", "col_b": "float"})
+
+    out_df = cleaner.convert_types(input_df)
+    assert out_df is input_df
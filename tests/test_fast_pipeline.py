@@ -0,0 +1,70 @@
+"""utilities.fast_pipeline test suite"""
+
+import numpy as np
+import pandas as pd
+from utilities.fast_pipeline import clean_and_aggregate
+
+
+def test_clean_and_aggregate(helpers, aggregator):
+    """
+    Clean data and calculate aggregates, skipping missing values, uneven rows,
+    empty strings and values not greater than 0.
+    """
+    input_df = pd.DataFrame(
+        {
+            "col_a": [
+                "['tosh1.moc']",
+                "['tosh2.moc','tosh1.moc']",
+                "['tosh1.moc','tosh2.moc']",
+                "['tosh1.moc',,'tosh2.moc','tosh3.moc']",
+                np.nan,
+            ],
+            "col_b": [
+                "[1]",
+                "[2,9]",
+                "[3]",
+                "[4,5,-1,0]",
+                "[7]",
+            ],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc"],
+            "min": [1.0, 2.0],
+            "max": [9.0, 2.0],
+            "avg": [14 / 3, 2.0],
+            "sum": [14.0, 2.0],
+        }
+    )
+    out_df = clean_and_aggregate(input_df, aggregator)
+    assert helpers.df_equal(out_df, expected_df)
+
+
+def test_clean_and_aggregate_empty(aggregator):
+    """Return empty dataframe when all rows are filtered out."""
+    input_df = pd.DataFrame({"col_a": ["['tosh1.moc']"], "col_b": ["[0]"]})
+    out_df = clean_and_aggregate(input_df, aggregator)
+    assert out_df.empty
+    assert [*out_df.columns] == ["col_a", "min", "max", "avg", "sum"]
+
+
+def test_clean_and_aggregate_empty_lists(helpers, aggregator):
+    """Skip rows with empty lists without shifting elements of other rows."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["[]", "['tosh1.moc']", "[]", "['tosh2.moc']"],
+            "col_b": ["[]", "[1]", "[5]", "[2]"],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc", "tosh2.moc"],
+            "min": [1.0, 2.0],
+            "max": [1.0, 2.0],
+            "avg": [1.0, 2.0],
+            "sum": [1.0, 2.0],
+        }
+    )
+    out_df = clean_and_aggregate(input_df, aggregator)
+    assert helpers.df_equal(out_df, expected_df)
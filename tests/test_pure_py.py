@@ -0,0 +1,65 @@
+"""utilities.pure_py test suite"""
+
+import pytest
+from utilities import pure_py
+
+
+def test_read_rows(tmp_path):
+    """Read pairs of grouping and values columns from csv file."""
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(
+        '"col_b","col_a"\n"[1301.62]","[\'tosh1.moc\']"\n,"[\'tosh2.moc\']"\n'
+    )
+    rows = pure_py.read_rows(str(input_path), ["col_b", "col_a"], "col_a", "col_b")
+    assert list(rows) == [("['tosh1.moc']", "[1301.62]"), ("['tosh2.moc']", "")]
+
+
+def test_read_rows_wrong_columns(tmp_path):
+    """Raise AssertionError when csv file columns do not match provided ones."""
+    input_path = tmp_path / "input.csv"
+    input_path.write_text('"col_a","col_b"\n')
+    with pytest.raises(AssertionError):
+        list(pure_py.read_rows(str(input_path), ["col_a"], "col_a", "col_b"))
+
+
+def test_clean_and_group():
+    """
+    Group values by hosts, skipping missing values, uneven rows,
+    empty strings and values not greater than 0.
+    """
+    rows = [
+        ("['tosh1.moc']", "[1]"),
+        ("['tosh2.moc','tosh1.moc']", "[2,9]"),
+        ("['tosh1.moc','tosh2.moc']", "[3]"),
+        ("['tosh1.moc',,'tosh2.moc','tosh3.moc']", "[4,5,-1,0]"),
+        ("['tosh1.moc']", "NULL"),
+    ]
+    assert pure_py.clean_and_group(iter(rows)) == {
+        "tosh1.moc": [1.0, 9.0, 4.0],
+        "tosh2.moc": [2.0],
+    }
+
+
+@pytest.mark.parametrize(
+    "aggregates,expected",
+    [
+        (
+            ["min", "max", "avg", "sum"],
+            [["tosh1.moc", 1, 9, 5, 10], ["tosh2.moc", 1, 2, 1.5, 3]],
+        ),
+        (["sum"], [["tosh1.moc", 10], ["tosh2.moc", 3]]),
+    ],
+)
+def test_calculate_aggregates(aggregates, expected):
+    """Calculate aggregates for each group of values, sorted by group."""
+    groups = {"tosh2.moc": [1.0, 2.0], "tosh1.moc": [9.0, 1.0]}
+    assert pure_py.calculate_aggregates(groups, aggregates) == expected
+
+
+def test_write_rows(tmp_path):
+    """Save rows to csv file in the same format as pandas."""
+    output_path = tmp_path / "output.csv"
+    pure_py.write_rows(
+        str(output_path), ["host", "max"], [["tosh1.moc", 9977.0], ["tosh,2", 0.5]]
+    )
+    assert output_path.read_text() == 'host,max\ntosh1.moc,9977.0\n"tosh,2",0.5\n'
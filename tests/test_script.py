@@ -0,0 +1,126 @@
+"""script test suite"""
+
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+import script
+
+COLUMNS_INFO = {"col_a": "string", "col_b": "float"}
+
+INPUT_CSV = (
+    '"col_a","col_b"\n'
+    '"[\'tosh1.moc\']","[3063.33]"\n'
+    "\"['tosh2.moc','tosh4.moc']\",\"[1301.62,9203.05]\"\n"
+    "\"['tosh1.moc','tosh4.moc']\",\"[7026.18,0]\"\n"
+    '"[\'tosh2.moc\']","[6647.35,9618.39]"\n'
+    "\"['tosh4.moc','tosh2.moc']\",\"[8697.18,17.5]\"\n"
+)
+
+
+def run_main(tmp_path, input_csv: str, **kwargs) -> pd.DataFrame:
+    """Run main on given csv file contents and read back its output."""
+    input_path, output_path = tmp_path / "input.csv", tmp_path / "output.csv"
+    input_path.write_text(input_csv)
+    script.main(
+        input_path=str(input_path),
+        output_path=str(output_path),
+        columns_info=COLUMNS_INFO,
+        agg_col="col_a",
+        values_col="col_b",
+        aggregates=["min", "max", "avg", "sum"],
+        **kwargs,
+    )
+    return pd.read_csv(output_path)
+
+
+def test_process_chunk(helpers, cleaner, aggregator):
+    """Clean chunk of the data and calculate partial results for it."""
+    input_df = pd.DataFrame(
+        {
+            "col_a": ["['tosh1.moc','tosh2.moc']", "['tosh1.moc']", "['tosh2.moc']"],
+            "col_b": ["[2,-1]", "[3]", "[1,5]"],
+        }
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc"],
+            "min": [2.0],
+            "max": [3.0],
+            "sum": [5.0],
+            "count": [2],
+        }
+    )
+    out_df = script.process_chunk(input_df, cleaner, aggregator)
+    assert helpers.df_equal(out_df, expected_df, check_dtype=False)
+
+
+def test_main_chunks_in_parallel(helpers, tmp_path):
+    """Return same results for single-row chunks processed by many workers."""
+    expected_df = run_main(tmp_path, INPUT_CSV, chunksize=len(INPUT_CSV))
+    out_df = run_main(tmp_path, INPUT_CSV, chunksize=1, max_workers=2)
+    assert len(out_df) == 3
+    assert helpers.df_equal(out_df, expected_df)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"chunksize": len(INPUT_CSV)}, {"chunksize": 1, "max_workers": 1}]
+)
+def test_main_without_workers(helpers, tmp_path, monkeypatch, kwargs):
+    """Process chunks in main process when there is nothing to parallelize."""
+    expected_df = run_main(tmp_path, INPUT_CSV, chunksize=1, max_workers=2)
+    monkeypatch.setattr(script, "ProcessPoolExecutor", None)
+    out_df = run_main(tmp_path, INPUT_CSV, **kwargs)
+    assert helpers.df_equal(out_df, expected_df)
+
+
+@pytest.mark.parametrize("backend", script.BACKENDS)
+def test_main_empty_elements(helpers, tmp_path, backend):
+    """Skip empty host and value elements one by one, with each of the backends."""
+    input_csv = (
+        '"col_a","col_b"\n'
+        "\"['tosh1.moc','tosh2.moc','tosh1.moc']\",\"[1,,2]\"\n"
+        "\"['tosh1.moc',,'tosh1.moc']\",\"[3,5,4]\"\n"
+        "\"['tosh2.moc','tosh3.moc']\",\",,\"\n"
+    )
+    expected_df = pd.DataFrame(
+        {
+            "col_a": ["tosh1.moc"],
+            "min": [1.0],
+            "max": [4.0],
+            "avg": [2.5],
+            "sum": [10.0],
+        }
+    )
+    out_df = run_main(tmp_path, input_csv, backend=backend)
+    assert helpers.df_equal(out_df, expected_df)
+
+
+@pytest.mark.parametrize("writer", ["pyarrow", "pandas"])
+@pytest.mark.parametrize(
+    "host,expected_host", [("tosh1.moc", "tosh1.moc"), ("tosh,1", '"tosh,1"')]
+)
+def test_write_csv(tmp_path, monkeypatch, writer, host, expected_host):
+    """Write same csv file with pyarrow and with pandas."""
+    if writer == "pandas":
+        monkeypatch.setattr(script, "pa", None)
+    output_path = tmp_path / "output.csv"
+    input_df = pd.DataFrame(
+        {"host": [host, "tosh2.moc"], "max": [9977.0, 0.1 + 0.2], "count": [1, 2]}
+    )
+    script.write_csv(input_df, str(output_path))
+    assert output_path.read_text() == (
+        "host,max,count\n"
+        f"{expected_host},9977.0,1\n"
+        "tosh2.moc,0.30000000000000004,2\n"
+    )
+
+
+def test_import_without_numba():
+    """Import script without importing Numba, which is needed by numba backend only."""
+    code = "import sys, script; assert 'numba' not in sys.modules"
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=os.path.dirname(script.__file__), check=True
+    )
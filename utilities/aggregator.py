@@ -7,13 +7,33 @@ Supports following aggregate calculations:
     * sum - calculates sum of all elements
 """
 
+import functools
 import logging
+from typing import Collection, Tuple
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+AGGREGATES_MAP = {
+    "min": "min",
+    "max": "max",
+    "avg": "mean",
+    "sum": "sum",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_aggs(aggregates: Tuple[str, ...]) -> Tuple[tuple, tuple]:
+    """
+    Resolve aggregates names into pandas GroupBy reductions names
+    and aggregates names, both in AGGREGATES_MAP order.
+    Cached, so each distinct set of aggregates is resolved only once.
+    """
+    resolved = [(k, v) for k, v in AGGREGATES_MAP.items() if k in aggregates]
+    return tuple(v for _, v in resolved), tuple(k for k, _ in resolved)
+
 
 class Aggregator:
     """
@@ -24,33 +44,44 @@ class Aggregator:
         * avg - calculates average (mean) value of a group of elements
         * sum - calculates sum of all elements
     Aggregate calculations can be extended through AGGREGATES_MAP by
-        adding additional NumPy function.
+        adding name of additional pandas GroupBy reduction.
 
     Instance variables:
         * agg_col (str): name of the dataframe column to group data by
         * values_col (str): name of the column containing values
             to calculate aggregates from
         * aggregates (list): list of strings of aggregate functions names
-        * agg_funcs (list): list of aggregate functions objects
+        * agg_funcs (tuple): pandas GroupBy reductions names
             based on passed "aggregates"
-        * agg_names (list): list of aggregate functions names
+        * agg_names (tuple): aggregate functions names
             based on passed "aggregates"
+        * engine (str): "cython" to use pandas built-in GroupBy reductions,
+            "numba" to use a single pass of a kernel jit-compiled with Numba,
+            "numpy" to use NumPy ufunc reductions over sorted groups
 
     Methods:
         * validate_input: check if input dataframe contains columns
             passed as "agg_col" and "values_col"
         * calculate_aggregates: perform aggregate calculations,
             return grouped df with results in corresponding columns
+        * calculate_partials: calculate partial results (min, max, sum, count)
+            for part of the data, that can be combined with other parts later
+        * combine_partials: combine partial results of all parts of the data
+            into final aggregates
     """
 
-    AGGREGATES_MAP = {
-        "min": np.min,
-        "max": np.max,
-        "avg": np.mean,
-        "sum": np.sum,
+    PARTIALS_MAP = {
+        "min": "min",
+        "max": "max",
+        "sum": "sum",
+        "count": "count",
     }
 
-    def __init__(self, agg_col: str, values_col: str, aggregates: list):
+    ENGINES = ["cython", "numba", "numpy"]
+
+    def __init__(
+        self, agg_col: str, values_col: str, aggregates: list, engine: str = "cython"
+    ):
         """
         Validate input aggregates and create an instance if no errors.
 
@@ -59,42 +90,137 @@ class Aggregator:
             * values_col (str): name of the column containing values
                 to calculate aggregates from
             * aggregates (list): list of strings of aggregate functions names
+            * engine (str) (optional): "cython" to use pandas built-in
+                GroupBy reductions, "numba" to use a single pass of a kernel
+                jit-compiled with Numba, "numpy" to use NumPy ufunc reductions
+                over sorted groups
 
         Raises:
             * AssertionError if unsupported aggregate(s) in passed
                 "aggregates" is/are found
+            * AssertionError if unsupported engine is passed
         """
+        assert engine in self.ENGINES, (
+            f"Provided engine: {engine} not supported.",
+            f"List of supported engines: {self.ENGINES}",
+        )
+        self.engine = engine
         self.aggregates = aggregates
         self._validate_aggregates(self.aggregates)
-        self.agg_funcs = [
-            v for k, v in self.AGGREGATES_MAP.items() if k in self.aggregates
-        ]
-        self.agg_names = [
-            k for k, v in self.AGGREGATES_MAP.items() if k in self.aggregates
-        ]
+        self.agg_funcs, self.agg_names = _resolve_aggs(tuple(self.aggregates))
         self.agg_col = agg_col
         self.values_col = values_col
 
     def __repr__(self):
-        return str(
-            f"Aggregator calculating {self.agg_names} from '{self.values_col}'",
-            f" grouped by '{self.agg_col}' column.",
+        return (
+            f"Aggregator calculating {self.agg_names} from '{self.values_col}'"
+            f" grouped by '{self.agg_col}' column."
         )
 
     def _validate_aggregates(self, aggregates: list) -> None:
         logger.info(
-            (
-                "Checking if each of the provided aggregates is supported.",
-                f"Supported aggregates are: {[*self.AGGREGATES_MAP.keys()]}.",
-            )
+            "Checking if each of the provided aggregates is supported. "
+            "Supported aggregates are: %s.",
+            AGGREGATES_MAP.keys(),
         )
-        supported_aggs = set(self.AGGREGATES_MAP.keys())
+        supported_aggs = set(AGGREGATES_MAP.keys())
         input_aggs = set(aggregates)
         aggs_diff = input_aggs.difference(supported_aggs)
         assert not aggs_diff, (
             f"Provided aggregate calculation(s): {aggs_diff} not supported.",
-            f"List of supported calculations: {[*self.AGGREGATES_MAP.keys()]}",
+            f"List of supported calculations: {[*AGGREGATES_MAP.keys()]}",
+        )
+
+    def _fast_groupby(self, keys: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+        """
+        Calculate min, max, sum, count and mean of values for each group of keys
+        with NumPy ufunc reductions over values sorted by group.
+        Missing keys and values are skipped, same as by pandas GroupBy,
+        so keys with missing values only have count and sum of 0 and NaN otherwise.
+        """
+        codes, uniques = pd.factorize(keys, sort=True)
+        valid = (codes >= 0) & pd.notna(values)
+        codes, values = codes[valid], values[valid]
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        reduced = {
+            "min": np.minimum.reduceat(values, starts),
+            "max": np.maximum.reduceat(values, starts),
+            "sum": np.add.reduceat(values, starts),
+            "count": np.diff(np.append(starts, len(codes))),
+        }
+        if len(starts) < len(uniques):
+            # Reductions of keys with any valid values are placed at their codes.
+            found = codes[starts]
+            for func, fill in (
+                ("min", np.nan),
+                ("max", np.nan),
+                ("sum", 0),
+                ("count", 0),
+            ):
+                spread = np.full(
+                    len(uniques), fill, dtype=np.result_type(reduced[func], fill)
+                )
+                spread[found] = reduced[func]
+                reduced[func] = spread
+        with np.errstate(invalid="ignore", divide="ignore"):
+            reduced["mean"] = reduced["sum"] / reduced["count"]
+        return pd.DataFrame({f"{self.agg_col}": uniques, **reduced})
+
+    def _jit_groupby(self, keys: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+        """
+        Calculate min, max, sum, count and mean of values for each group of keys
+        in a single pass of a Numba JIT-compiled kernel.
+        Missing keys and values are skipped, same as by pandas GroupBy.
+        """
+        # Imported only here, as Numba is optional and does not support PyPy.
+        from utilities.numba_kernels import (  # pylint: disable = C0415
+            reduce_groups,
+        )
+
+        codes, uniques = pd.factorize(keys, sort=True)
+        accs = reduce_groups(codes, values.astype(np.float64, copy=False), len(uniques))
+        counts = accs[:, 3].astype(np.int64)
+        empty = counts == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame(
+                {
+                    f"{self.agg_col}": uniques,
+                    "min": np.where(empty, np.nan, accs[:, 0]),
+                    "max": np.where(empty, np.nan, accs[:, 1]),
+                    "sum": accs[:, 2],
+                    "count": counts,
+                    "mean": accs[:, 2] / counts,
+                }
+            )
+
+    def _reduce(
+        self, dframe: pd.DataFrame, names: Collection[str], funcs: Collection[str]
+    ) -> pd.DataFrame:
+        keys_dtype = dframe[f"{self.agg_col}"].dtype
+        if self.engine in ("numpy", "numba"):
+            groupby = (
+                self._fast_groupby if self.engine == "numpy" else self._jit_groupby
+            )
+            dframe = groupby(
+                dframe[f"{self.agg_col}"].to_numpy(),
+                dframe[f"{self.values_col}"].to_numpy(),
+            )
+            dframe = dframe[[f"{self.agg_col}", *funcs]]
+            dframe.columns = [f"{self.agg_col}", *names]
+            return dframe.astype({f"{self.agg_col}": keys_dtype})
+
+        # Group by categorical codes, so group keys are hashed only once.
+        # All categories are observed, as they are created from the grouped column.
+        dframe = dframe.assign(
+            **{f"{self.agg_col}": dframe[f"{self.agg_col}"].astype("category")}
         )
+        df_grouped = dframe.groupby(f"{self.agg_col}", observed=False)
+        dframe = df_grouped.agg(
+            **{name: (f"{self.values_col}", func) for name, func in zip(names, funcs)}
+        ).reset_index()
+        return dframe.astype({f"{self.agg_col}": keys_dtype})
 
     def validate_input(self, dframe: pd.DataFrame) -> None:
         """
@@ -108,11 +234,13 @@ class Aggregator:
                 is not found in dataframe
         """
         logger.info(
-            f'Checking if input dataframe contains "{self.agg_col}"',
-            f'and "{self.values_col}" columns.',
+            'Checking if input dataframe contains "%s" and "%s" columns.',
+            self.agg_col,
+            self.values_col,
         )
+        df_columns = dframe.columns
         for col in [self.agg_col, self.values_col]:
-            assert col in [*dframe.columns], f"Input dataframe does not contain {col}."
+            assert col in df_columns, f"Input dataframe does not contain {col}."
 
     def calculate_aggregates(self, dframe: pd.DataFrame) -> pd.DataFrame:
         """
@@ -127,12 +255,56 @@ class Aggregator:
                 data and calculated aggregates
         """
         logger.info(
-            f"Calculating: {self.agg_names} for: {self.values_col}",
-            f"grouped by: {self.agg_col}.",
+            "Calculating: %s for: %s grouped by: %s.",
+            self.agg_names,
+            self.values_col,
+            self.agg_col,
+        )
+        return self._reduce(dframe, self.agg_names, self.agg_funcs)
+
+    def calculate_partials(self, dframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate partial results, from which aggregates of data split
+        into several parts can be combined.
+
+        Parameters:
+            * dframe (pd.DataFrame): part of the data to be
+                grouped and used to perform calculations
+
+        Returns:
+            * dframe (pd.DataFrame): dataframe with grouped data
+                and calculated partial results (min, max, sum, count)
+        """
+        logger.info(
+            "Calculating partials: %s for: %s grouped by: %s.",
+            self.PARTIALS_MAP.keys(),
+            self.values_col,
+            self.agg_col,
         )
+        return self._reduce(
+            dframe, self.PARTIALS_MAP.keys(), self.PARTIALS_MAP.values()
+        )
+
+    def combine_partials(self, dframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Combine partial results calculated for each part of the data
+        into aggregates.
+
+        Parameters:
+            * dframe (pd.DataFrame): concatenated partial results
+                of all parts of the data
+
+        Returns:
+            * dframe (pd.DataFrame): dataframe with grouped
+                data and calculated aggregates
+        """
+        logger.info("Combining partials into: %s.", self.agg_names)
         df_grouped = dframe.groupby(f"{self.agg_col}")
-        dframe = df_grouped.agg({f"{self.values_col}": [*self.agg_funcs]}).reset_index()
-        df_columns = [f"{self.agg_col}"]
-        df_columns.extend(self.agg_names)
-        dframe.columns = df_columns
-        return dframe
+        dframe = df_grouped.agg(
+            min=("min", "min"),
+            max=("max", "max"),
+            sum=("sum", "sum"),
+            count=("count", "sum"),
+        ).reset_index()
+        dframe["avg"] = dframe["sum"] / dframe["count"]
+        return dframe[[f"{self.agg_col}", *self.agg_names]]
@@ -2,13 +2,20 @@
 Clean data in given pandas DataFrame.
 """
 
+import functools
 import logging
+import operator
+import re
 
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Matches contents of each element of a list-like looking string, without quotes.
+# Empty elements are matched too, so elements keep their positions.
+LIST_ELEMENT = re.compile(r"(?:^\[?|,)'?([^,'\]]*)'?")
+
 
 class Cleaner:
     """
@@ -23,15 +30,22 @@ class Cleaner:
             contains columns provided in "columns_info"
         * list_from_string: transform dataframe elements from
             list-like looking strings into lists
+        * even_rows_mask: mask rows with even number of elements
         * filter_uneven_rows: filter out rows with uneven number of elements
+        * greater_than_zero_mask: mask rows with values
+            in numeric columns greater than 0
         * filter_greater_than_zero: filter out rows with values
             in numeric columns not greater than 0
+        * non_empty_mask: mask rows without missing or empty string values
+            in string columns
         * drop_empty_string: filter out rows with empty string values
         * convert_types: cast columns to provided types
     """
 
     NUMERIC_TYPES = ["float", "int"]
 
+    STRING_TYPES = ["string"]
+
     def __init__(self, columns_info: dict):
         """
         Parameters:
@@ -39,14 +53,32 @@ class Cleaner:
                 and their data types. (keys: column names, values: data types)
         """
         self.columns_info = columns_info
+        self._expected_cols = tuple(columns_info)
+        self._numeric_cols = tuple(
+            k for k, v in columns_info.items() if v in self.NUMERIC_TYPES
+        )
+        self._string_cols = tuple(
+            k for k, v in columns_info.items() if v in self.STRING_TYPES
+        )
 
     def __repr__(self):
         return f"Cleaner for data with columns: {self.columns_info}"
 
     @staticmethod
-    def _convert_to_list(value: str) -> list:
-        logger.debug(f"Converting string: {value} to list.")
-        return value.strip("[]").split(",")
+    def _parse_str_col(column: pd.Series) -> pd.Series:
+        return column.str.findall(LIST_ELEMENT)
+
+    @staticmethod
+    def _parse_num_col(column: pd.Series) -> pd.Series:
+        return column.str.strip("[]").str.split(",")
+
+    @staticmethod
+    def _to_numeric(column: pd.Series, col_type: str) -> pd.Series:
+        try:
+            return column.astype(col_type)
+        except ValueError:
+            # Parsed again only if some elements (e.g. empty strings) are not numbers.
+            return pd.to_numeric(column, errors="coerce").astype(col_type)
 
     def validate_input(self, dframe: pd.DataFrame) -> None:
         """
@@ -59,17 +91,21 @@ class Cleaner:
             * AssertionError if dataframe columns do not match passed columns info
         """
         logger.info(
-            f"Validating input data columns: {[*dframe.columns]}",
-            f" with provided columns: {[*self.columns_info.keys()]}.",
+            "Validating input data columns: %s with provided columns: %s.",
+            dframe.columns,
+            self._expected_cols,
         )
-        assert [*dframe.columns] == [
-            *self.columns_info.keys()
-        ], "Dataframe columns do not match provided columns info."
+        assert (
+            tuple(dframe.columns) == self._expected_cols
+        ), "Dataframe columns do not match provided columns info."
 
     def list_from_string(self, dframe: pd.DataFrame) -> pd.DataFrame:
         """
         Convert each dataframe element from list-like looking string
-        e.g.: "["value1","value2"]" into actual list.
+        e.g.: "['value1','value2']" into actual list.
+        Elements of string columns are taken without their single quotes,
+        elements of numeric columns are split on commas and are parsed
+        into numbers by "convert_types", once exploded into a flat column.
 
         Parameters:
             * dframe (pd.DataFrame): dataframe where each element
@@ -81,7 +117,36 @@ class Cleaner:
         logger.info(
             "Converting each dataframe element from list-like looking string into list."
         )
-        return dframe.applymap(self._convert_to_list)
+        return dframe.assign(
+            **{
+                col: (
+                    self._parse_num_col(dframe[col])
+                    if self.columns_info.get(col) in self.NUMERIC_TYPES
+                    else self._parse_str_col(dframe[col])
+                )
+                for col in dframe.columns
+            }
+        )
+
+    def even_rows_mask(self, dframe: pd.DataFrame) -> np.ndarray:
+        """
+        Mask rows with even number of elements in each column.
+        Rows with missing values are masked out, as their length is NaN.
+
+        Parameters:
+            * dframe (pd.DataFrame): dataframe where each element
+                is a sequence or a collection
+
+        Returns:
+            * filt (np.ndarray): boolean mask, True for rows with even
+                number of elements
+        """
+        logger.info("Masking rows with uneven number of elements in columns.")
+        lengths = [
+            dframe[col].map(len, na_action="ignore").to_numpy()
+            for col in self.columns_info
+        ]
+        return np.logical_and.reduce([length == lengths[0] for length in lengths])
 
     def filter_uneven_rows(self, dframe: pd.DataFrame) -> pd.DataFrame:
         """
@@ -94,49 +159,85 @@ class Cleaner:
         Returns:
             * dframe (pd.DataFrame): dataframe with uneven rows filtered out
         """
-        logger.info("Filtering out rows with uneven number of elements in columns.")
-        dframe["length_diff"] = dframe.applymap(len).apply(np.diff, axis=1).apply(int)
-        filt = dframe["length_diff"] == 0
+        filt = self.even_rows_mask(dframe)
         return dframe.loc[filt, [*self.columns_info.keys()]].reset_index(drop=True)
 
-    def filter_greater_than_zero(self, dframe: pd.DataFrame) -> pd.DataFrame:
+    def greater_than_zero_mask(self, dframe: pd.DataFrame) -> np.ndarray:
         """
-        Filter out rows with values in numeric columns not greater than 0.
+        Mask rows with values in numeric columns greater than 0.
 
         Parameters:
             * dframe (pd.DataFrame): dataframe with numeric
                 (supported: "int" or "float") columns
 
         Returns:
-            * dframe (pd.DataFrame): dataframe with
-                non-positive values in numeric columns filtered out
+            * filt (np.ndarray): boolean mask, True for rows with
+                positive values in numeric columns
 
         Raises:
             * AssertionError if no numeric columns
                 ("int" or "float") are found in cleaners "columns_info"
         """
-        numeric_columns = [
-            k for k, v in self.columns_info.items() if v in self.NUMERIC_TYPES
-        ]
-        assert numeric_columns, (
+        assert self._numeric_cols, (
             "No columns of numeric types in the provided columns_info.",
             f" Numeric types are {self.NUMERIC_TYPES}.",
         )
         logger.info(
-            (
-                "Filtering out rows with values not greater than 0 ",
-                f"in numeric columns: {numeric_columns}.",
-            )
+            "Masking rows with values greater than 0 in numeric columns: %s.",
+            self._numeric_cols,
+        )
+        if len(self._numeric_cols) == 1:
+            return dframe[self._numeric_cols[0]].to_numpy() > 0
+        return np.logical_and.reduce(
+            [dframe[col].to_numpy() > 0 for col in self._numeric_cols]
         )
-        if len(numeric_columns) == 1:
-            filt = dframe[numeric_columns[0]] > 0
-        else:
-            # FIXME: Raises "ValueError: Cannot index with multidimensional key" # pylint: disable = w0511
-            filt = dframe[numeric_columns] > 0
+
+    def filter_greater_than_zero(self, dframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filter out rows with values in numeric columns not greater than 0.
+
+        Parameters:
+            * dframe (pd.DataFrame): dataframe with numeric
+                (supported: "int" or "float") columns
+
+        Returns:
+            * dframe (pd.DataFrame): dataframe with
+                non-positive values in numeric columns filtered out
+
+        Raises:
+            * AssertionError if no numeric columns
+                ("int" or "float") are found in cleaners "columns_info"
+        """
+        filt = self.greater_than_zero_mask(dframe)
         return dframe.loc[filt].reset_index(drop=True)
 
-    @staticmethod
-    def drop_empty_string(dframe: pd.DataFrame) -> pd.DataFrame:
+    def non_empty_mask(self, dframe: pd.DataFrame) -> np.ndarray:
+        """
+        Mask rows without missing or empty string values in string columns.
+        Other columns are not checked, non-positive or missing numeric values
+        are masked out by "greater_than_zero_mask".
+
+        Parameters:
+            *dframe (pd.DataFrame): dataframe to mask empty string values in
+
+        Returns:
+            *filt (np.ndarray): boolean mask, True for rows without
+                missing or empty string values
+        """
+        logger.info(
+            "Masking rows with missing or empty values in columns: %s.",
+            self._string_cols,
+        )
+        return functools.reduce(
+            operator.and_,
+            [
+                (dframe[col].notna() & (dframe[col] != "")).to_numpy()
+                for col in self._string_cols
+            ],
+            np.ones(len(dframe), dtype=bool),
+        )
+
+    def drop_empty_string(self, dframe: pd.DataFrame) -> pd.DataFrame:
         """
         Filter out rows with empty string values.
 
@@ -146,9 +247,8 @@ class Cleaner:
         Returns:
             *dframe (pd.DataFrame): dataframe with empty string values filtered out
         """
-        logger.info("Filtering out rows with empty string values.")
-        dframe.replace("", np.nan, inplace=True)
-        return dframe.dropna().reset_index(drop=True)
+        filt = self.non_empty_mask(dframe)
+        return dframe.loc[filt].reset_index(drop=True)
 
     def convert_types(
         self, dframe: pd.DataFrame, columns_info: dict = None
@@ -162,11 +262,27 @@ class Cleaner:
                 columns and their data types. (keys: column names, values: data types)
 
         Returns:
-            *dframe (pd.DataFrame): dataframe after column casting
+            *dframe (pd.DataFrame): dataframe after column casting,
+                columns already of given type are not copied,
+                elements of numeric columns that are not numbers
+                (e.g. empty strings) become NaN
         """
+        columns_info = columns_info or self.columns_info
         logger.info(
-            f"Casting columns types based on given columns info: {self.columns_info}"
+            "Casting columns types based on given columns info: %s", columns_info
+        )
+        to_cast = {
+            col: col_type
+            for col, col_type in columns_info.items()
+            if dframe[col].dtype != pd.api.types.pandas_dtype(col_type)
+        }
+        if not to_cast:
+            return dframe
+        dframe = dframe.assign(
+            **{
+                col: self._to_numeric(dframe[col], col_type)
+                for col, col_type in to_cast.items()
+                if col_type in self.NUMERIC_TYPES
+            }
         )
-        if columns_info:
-            return dframe.astype(columns_info)
-        return dframe.astype(self.columns_info)
+        return dframe.astype(to_cast)
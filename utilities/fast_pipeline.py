@@ -0,0 +1,88 @@
+"""
+Clean and aggregate data in a single pass with a Numba JIT-compiled kernel.
+Equivalent of the Cleaner -> Aggregator pipeline for data with one column of hosts
+and one column of values, both stored as list-like looking strings.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from utilities.aggregator import Aggregator
+from utilities.cleaner import LIST_ELEMENT
+from utilities.numba_kernels import accumulate, new_accumulators
+
+logger = logging.getLogger(__name__)
+
+
+def _flatten(lists: pd.Series) -> tuple:
+    """
+    Flatten lists into array of elements
+    and array of offsets marking where each row starts.
+    """
+    lengths = lists.str.len().to_numpy()
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    # explode turns empty lists into NaN elements, so they are left out
+    return lists[lengths > 0].explode().to_numpy(), offsets
+
+
+@njit(cache=True)
+def _aggregate(codes, host_offsets, values, value_offsets, n_groups):
+    accs = new_accumulators(n_groups)
+    for row in range(len(host_offsets) - 1):
+        start = host_offsets[row]
+        values_start = value_offsets[row]
+        length = host_offsets[row + 1] - start
+        if length != value_offsets[row + 1] - values_start:
+            continue
+        for i in range(length):
+            code = codes[start + i]
+            value = values[values_start + i]
+            if code >= 0 and value > 0:
+                accumulate(accs, code, value)
+    return accs
+
+
+def clean_and_aggregate(dframe: pd.DataFrame, aggregator: Aggregator) -> pd.DataFrame:
+    """
+    Clean data and calculate aggregates in a single pass over the data.
+    Rows with missing values or uneven number of elements are skipped,
+    as well as elements with empty hosts or values not greater than 0.
+
+    Parameters:
+        * dframe (pd.DataFrame): dataframe where each element
+            is list-like looking string
+        * aggregator (Aggregator): aggregator describing grouping column,
+            values column and aggregates to calculate
+
+    Returns:
+        * dframe (pd.DataFrame): dataframe with grouped
+            data and calculated aggregates
+    """
+    logger.info("Cleaning data and calculating aggregates with Numba kernel.")
+    dframe = dframe.dropna()
+    hosts, host_offsets = _flatten(dframe[aggregator.agg_col].str.findall(LIST_ELEMENT))
+    values, value_offsets = _flatten(
+        dframe[aggregator.values_col].str.strip("[]").str.split(",")
+    )
+    values = pd.Series(values).replace("", np.nan).to_numpy(dtype=np.float64)
+    # Hosts are hashed once here, the kernel accumulates by integer host codes.
+    codes, uniques = pd.factorize(hosts, sort=True)
+    codes[hosts == ""] = -1
+    accs = _aggregate(codes, host_offsets, values, value_offsets, len(uniques))
+
+    found = accs[:, 3] > 0
+    keys, accs = uniques[found], accs[found]
+    results = {
+        "min": accs[:, 0],
+        "max": accs[:, 1],
+        "avg": accs[:, 2] / accs[:, 3],
+        "sum": accs[:, 2],
+    }
+    out_df = pd.DataFrame({aggregator.agg_col: keys})
+    for name in aggregator.agg_names:
+        out_df[name] = results[name]
+    return out_df
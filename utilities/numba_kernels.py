@@ -0,0 +1,39 @@
+"""
+Kernels JIT-compiled with Numba, used by the "numba" engine of Aggregator
+and the "numba" backend. Numba is an optional dependency,
+so this module is imported only when needed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def new_accumulators(n_groups):
+    """Create accumulators of min, max, sum and count, one row for each group."""
+    accs = np.zeros((n_groups, 4))
+    accs[:, 0] = np.inf
+    accs[:, 1] = -np.inf
+    return accs
+
+
+@njit(cache=True)
+def accumulate(accs, code, value):
+    """Update accumulators of group with given code by value."""
+    accs[code, 0] = min(accs[code, 0], value)
+    accs[code, 1] = max(accs[code, 1], value)
+    accs[code, 2] += value
+    accs[code, 3] += 1
+
+
+@njit(cache=True)
+def reduce_groups(codes, values, n_groups):
+    """
+    Calculate min, max, sum and count of values for each group code
+    in a single pass, skipping missing codes (-1) and values.
+    """
+    accs = new_accumulators(n_groups)
+    for i, code in enumerate(codes):
+        if code >= 0 and not np.isnan(values[i]):
+            accumulate(accs, code, values[i])
+    return accs
@@ -0,0 +1,155 @@
+"""
+Clean and aggregate data with pure Python, without pandas or NumPy.
+Equivalent of the Cleaner -> Aggregator pipeline for data with one column of hosts
+and one column of values, both stored as list-like looking strings.
+Meant to be run with PyPy, which JIT-compiles the per-element string handling.
+"""
+
+import csv
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Matches contents of each element of a list-like looking string, without quotes.
+# Empty elements are matched too, so elements keep their positions.
+LIST_ELEMENT = re.compile(r"(?:^\[?|,)'?([^,'\]]*)'?")
+
+# Strings treated as missing values, same as by pandas.read_csv.
+NA_VALUES = {
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+}
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values)
+
+
+AGGREGATES_MAP = {
+    "min": min,
+    "max": max,
+    "avg": _mean,
+    "sum": sum,
+}
+
+
+def read_rows(
+    input_path: str, columns: list, agg_col: str, values_col: str
+) -> Iterator[Tuple[str, str]]:
+    """
+    Read pairs of grouping and values columns from csv file, row by row.
+
+    Parameters:
+        * input_path (str): path to the csv file containing data to process
+        * columns (list): expected columns of the csv file
+        * agg_col (str): name of the column to group data by
+        * values_col (str): name of the column containing values
+
+    Yields:
+        * (str, str): grouping and values column elements of each row
+
+    Raises:
+        * AssertionError if csv file columns do not match expected columns
+    """
+    logger.info("Reading data from: %s.", input_path)
+    with open(input_path, newline="", encoding="utf-8") as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        assert header == columns, "Csv file columns do not match provided columns."
+        agg_idx, values_idx = header.index(agg_col), header.index(values_col)
+        for row in reader:
+            yield row[agg_idx], row[values_idx]
+
+
+def clean_and_group(rows: Iterator[Tuple[str, str]]) -> Dict[str, List[float]]:
+    """
+    Clean pairs of list-like looking strings and group values by hosts.
+    Rows with missing values or uneven number of elements are skipped,
+    as well as elements with empty hosts or values not greater than 0.
+
+    Parameters:
+        * rows (Iterator[Tuple[str, str]]): pairs of list-like looking strings
+            of hosts and values
+
+    Returns:
+        * groups (dict): values grouped by hosts
+            (keys: hosts, values: lists of values)
+    """
+    logger.info("Cleaning and grouping data.")
+    groups: Dict[str, List[float]] = {}
+    for hosts, values in rows:
+        if hosts in NA_VALUES or values in NA_VALUES:
+            continue
+        hosts_list = LIST_ELEMENT.findall(hosts)
+        values_list = values.strip("[]").split(",")
+        if len(hosts_list) != len(values_list):
+            continue
+        for host, value in zip(hosts_list, values_list):
+            if not host or not value:
+                continue
+            number = float(value)
+            if number > 0:
+                # Unlike setdefault, no empty list is created for hosts already seen.
+                group = groups.get(host)
+                if group is None:
+                    group = groups[host] = []
+                group.append(number)
+    return groups
+
+
+def calculate_aggregates(
+    groups: Dict[str, List[float]], aggregates: Sequence[str]
+) -> list:
+    """
+    Calculate aggregates for each group of values.
+
+    Parameters:
+        * groups (dict): values grouped by hosts
+            (keys: hosts, values: lists of values)
+        * aggregates (Sequence[str]): aggregate calculations to apply
+
+    Returns:
+        * rows (list): rows of host followed by calculated aggregates,
+            sorted by host
+    """
+    logger.info("Calculating: %s.", aggregates)
+    funcs = [AGGREGATES_MAP[name] for name in aggregates]
+    return [
+        [host, *(func(values) for func in funcs)]  # type: ignore
+        for host, values in sorted(groups.items())
+    ]
+
+
+def write_rows(output_path: str, header: list, rows: Iterable[list]) -> None:
+    """
+    Save rows to csv file, in the same format as pandas.DataFrame.to_csv.
+
+    Parameters:
+        * output_path (str): path to the csv file to save rows in
+        * header (list): names of the columns
+        * rows (Iterable[list]): rows to save
+    """
+    logger.info("Saving output data to: %s.", output_path)
+    with open(output_path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)